@@ -1,8 +1,24 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from mcp.server.fastmcp import FastMCP
 
+from .client import _close_http_client
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        # Drain pooled upstream connections before the event loop shuts down.
+        await _close_http_client()
+
+
 mcp = FastMCP(
     "fred-mcp",
     instructions=(
         "Query FRED API v1, GeoFRED maps API, and FRED API v2 release observations."
     ),
+    lifespan=_lifespan,
 )
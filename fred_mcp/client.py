@@ -1,35 +1,106 @@
 import asyncio
-import json
+import contextlib
+import functools
+import importlib.util
 import logging
+import math
 import os
+import random
 import re
-from typing import Any
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, TypeVar
+from weakref import WeakKeyDictionary
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 from .errors import FredServerError, _error_payload
+from .limiter import _create_redis_limiter, _RedisConcurrencyLimiter
 
 FRED_API_BASE = "https://api.stlouisfed.org/fred"
 GEOFRED_API_BASE = "https://api.stlouisfed.org/geofred"
 FRED_V2_API_BASE = "https://api.stlouisfed.org/fred/v2"
 
 HTTP_TIMEOUT_SECONDS = 30.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+HTTP_POOL_SIZE = 64
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
 HTTP_MAX_RETRIES = 3
 BACKOFF_BASE_SECONDS = 0.5
 BACKOFF_MAX_SECONDS = 8.0
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+URL_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL_SECONDS = 600
+RESPONSE_CACHE_MAX_ENTRIES = 512
+# Revalidation also covers time-sensitive endpoints, whose pages can hold up to
+# 100k rows; keep only small bodies so the decoded payloads stay bounded.
+VALIDATOR_CACHE_MAX_ENTRIES = 256
+VALIDATOR_CACHE_MAX_BODY_BYTES = 64 * 1024
+
+# Time-sensitive data is never served from the response cache.
+_UNCACHED_ENDPOINTS = frozenset({
+    "series/observations",
+    "series/updates",
+    "releases/dates",
+    "release/dates",
+    "release/observations",
+})
+_UNCACHED_PARAMS = ("realtime_start", "realtime_end")
+# Near-static resources outlive the default TTL when upstream sends no max-age.
+_ENDPOINT_CACHE_TTLS: dict[str, int] = {
+    "shapes/file": 86400,
+    "series/group": 3600,
+}
+
+# Only these value types hash distinctly from their rendering (1 == 1.0 would not).
+_URL_CACHEABLE_TYPES = (str, int)
+
+# Dedicated generator, seeded once at import, for retry jitter.
+_retry_rng = random.Random()
+
+_API_KEY_RE = re.compile(r"(api_key=)[^&\s]+")
+_JSON_OBJECT_PREFIX_RE = re.compile(rb"\s*\{")
+_CACHE_MAX_AGE_RE = re.compile(r"\bmax-age\s*=\s*(\d+)")
+
+_T = TypeVar("_T")
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-_http_client: httpx.AsyncClient | None = None
-_http_client_lock: asyncio.Lock | None = None
+# Pooled connections are bound to the loop that opened them, so keep one
+# client per running loop instead of a process-wide singleton.
+_http_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    WeakKeyDictionary()
+)
+# LRU of (expires_at, payload); no await between lookup and store, so no lock.
+_response_cache: "OrderedDict[tuple[Any, ...], tuple[float, Any]]" = OrderedDict()
+# LRU of (etag, last_modified, payload) for revalidating with conditional GETs.
+_validator_cache: "OrderedDict[tuple[Any, ...], tuple[str | None, str | None, Any]]" = (
+    OrderedDict()
+)
+# Identical concurrent requests share one upstream call (single-flight).
+_inflight_requests: dict[tuple[Any, ...], "asyncio.Task[Any]"] = {}
+# Matching per-loop cap on in-flight requests, sized like the connection pool.
+_request_slots: "WeakKeyDictionary[asyncio.AbstractEventLoop, _AdmissionController]" = (
+    WeakKeyDictionary()
+)
+# Optional cross-process cap (REDIS_URL); Redis connections are loop-bound too.
+_global_limiters: (
+    "WeakKeyDictionary[asyncio.AbstractEventLoop, _RedisConcurrencyLimiter]"
+) = WeakKeyDictionary()
+# Monotonic deadline set by 429/503 backoffs; new requests wait it out too.
+_cooldown_until = 0.0
 
 
 def _redact_api_key_text(value: str) -> str:
-    return re.sub(r"(api_key=)[^&\s]+", r"\1***", value)
+    return _API_KEY_RE.sub(r"\1***", value)
 
 
 def _sanitize_log_params(params: dict[str, Any]) -> dict[str, Any]:
@@ -42,214 +113,702 @@ def _sanitize_log_params(params: dict[str, Any]) -> dict[str, Any]:
     return sanitized
 
 
+@dataclass(frozen=True, slots=True)
+class _Config:
+    api_key: str
+    pool_size: int
+    cache_ttl: int
+    redis_url: str
+    global_max_in_flight: int
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    raw = os.getenv(name, "").strip()
+    try:
+        value = int(raw) if raw else default
+    except ValueError:
+        value = default
+    return max(minimum, value)
+
+
+def _redis_url() -> str:
+    url = os.getenv("REDIS_URL", "").strip()
+    if url and importlib.util.find_spec("redis") is None:
+        # Checked once with the rest of the config, not on every request.
+        logger.error(
+            "REDIS_URL is set but redis is not installed; cross-worker request "
+            "limiting is disabled (install fred-mcp[redis])"
+        )
+        return ""
+    return url
+
+
+# Read the environment once per process; _config.cache_clear() re-reads it.
+@functools.lru_cache(maxsize=1)
+def _config() -> _Config:
+    return _Config(
+        api_key=os.getenv("FRED_API_KEY", "").strip(),
+        pool_size=_env_int("FRED_HTTP_POOL_SIZE", HTTP_POOL_SIZE, minimum=1),
+        cache_ttl=_env_int("FRED_CACHE_TTL", RESPONSE_CACHE_TTL_SECONDS, minimum=0),
+        redis_url=_redis_url(),
+        global_max_in_flight=_env_int(
+            "FRED_GLOBAL_MAX_IN_FLIGHT", HTTP_POOL_SIZE, minimum=1
+        ),
+    )
+
+
 def _fred_api_key() -> str:
-    key = os.getenv("FRED_API_KEY", "").strip()
+    key = _config().api_key
     if not key:
         raise ValueError("Missing FRED_API_KEY environment variable")
     return key
 
 
-def _clean_params(params: dict[str, Any]) -> dict[str, Any]:
-    cleaned: dict[str, Any] = {}
-    for key, value in params.items():
-        if value is None:
-            continue
-        if isinstance(value, bool):
-            cleaned[key] = str(value).lower()
-        else:
-            cleaned[key] = value
-    return cleaned
+def _prepare_query(params: dict[str, Any], api_key: str | None) -> dict[str, Any]:
+    # Single pass: drop unset values and render booleans the way FRED expects.
+    query = {
+        key: "true" if value is True else "false" if value is False else value
+        for key, value in params.items()
+        if value is not None
+    }
+    if api_key is not None:
+        query["api_key"] = api_key
+    query["file_type"] = "json"
+    return query
 
 
 def _parse_json_object(raw: str) -> dict[str, Any]:
+    # Passthrough tools default to "{}"; skip the decoder for that case.
+    if raw == "{}":
+        return {}
     try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError as exc:
         raise ValueError(f"Invalid JSON: {exc}") from exc
     if not isinstance(parsed, dict):
         raise ValueError("JSON value must be an object")
     return parsed
 
 
-async def _get_http_client() -> httpx.AsyncClient:
-    global _http_client, _http_client_lock
-    if _http_client is not None:
-        return _http_client
-    if _http_client_lock is None:
-        _http_client_lock = asyncio.Lock()
-    async with _http_client_lock:
-        if _http_client is None:
-            # Reuse one client so connections stay pooled across requests.
-            _http_client = httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS)
-    return _http_client
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _resolve_endpoint_url(base_url: str, endpoint: str) -> tuple[str, str]:
+    # The endpoint set is effectively fixed; strip and join each one only once.
+    normalized_endpoint = endpoint.strip("/")
+    return f"{base_url}/{normalized_endpoint}", normalized_endpoint
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _build_request_url(
+    url: str,
+    query_items: tuple[tuple[str, str | int], ...],
+) -> httpx.URL:
+    # Hot tools repeat the same query shapes; encode each shape only once.
+    return httpx.URL(url, params=query_items)
+
+
+def _query_items(query: dict[str, Any]) -> tuple[tuple[str, str | int], ...] | None:
+    # Hashable, order-independent form of a query, shared by the URL cache,
+    # the response cache and in-flight coalescing. Lists, dicts and floats
+    # from passthrough params have no such form and bypass all three.
+    if all(type(value) in _URL_CACHEABLE_TYPES for value in query.values()):
+        return tuple(sorted(query.items()))
+    return None
+
+
+def _response_cache_key(
+    parse_body: Callable[[bytes], Any],
+    url: str,
+    normalized_endpoint: str,
+    query_items: tuple[tuple[str, str | int], ...] | None,
+) -> tuple[Any, ...] | None:
+    if query_items is None or _config().cache_ttl <= 0:
+        return None
+    if normalized_endpoint in _UNCACHED_ENDPOINTS:
+        return None
+    if any(name in _UNCACHED_PARAMS for name, _ in query_items):
+        return None
+    return parse_body, url, query_items
+
+
+def _response_cache_get(key: tuple[Any, ...]) -> Any | None:
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, payload = entry
+    if expires_at <= time.monotonic():
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return payload
+
+
+def _response_ttl(endpoint: str, response: httpx.Response) -> int:
+    # Upstream Cache-Control wins; otherwise use the endpoint or default TTL.
+    cache_control = response.headers.get("cache-control")
+    if cache_control:
+        directives = cache_control.lower()
+        if "no-store" in directives or "no-cache" in directives:
+            return 0
+        match = _CACHE_MAX_AGE_RE.search(directives)
+        if match is not None:
+            return int(match.group(1))
+    return _ENDPOINT_CACHE_TTLS.get(endpoint, _config().cache_ttl)
+
+
+def _response_cache_put(key: tuple[Any, ...], payload: Any, ttl: int) -> None:
+    if ttl <= 0:
+        return
+    _response_cache[key] = (time.monotonic() + ttl, payload)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.popitem(last=False)
+
+
+def _conditional_headers(
+    headers: dict[str, str] | None,
+    validators: tuple[str | None, str | None, Any] | None,
+) -> dict[str, str] | None:
+    if validators is None:
+        return headers
+    etag, last_modified, _ = validators
+    conditional = dict(headers) if headers else {}
+    if etag is not None:
+        conditional["If-None-Match"] = etag
+    if last_modified is not None:
+        conditional["If-Modified-Since"] = last_modified
+    return conditional
+
+
+def _validator_cache_put(
+    key: tuple[Any, ...],
+    response: httpx.Response,
+    payload: Any,
+) -> None:
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if etag is None and last_modified is None:
+        return
+    if len(response.content) > VALIDATOR_CACHE_MAX_BODY_BYTES:
+        return
+    if "no-store" in response.headers.get("cache-control", "").lower():
+        return
+    _validator_cache[key] = (etag, last_modified, payload)
+    _validator_cache.move_to_end(key)
+    while len(_validator_cache) > VALIDATOR_CACHE_MAX_ENTRIES:
+        _validator_cache.popitem(last=False)
+
+
+class _AdmissionController:
+    """Async context manager capping in-flight requests with an AIMD limit.
+
+    The limit halves when upstream signals overload (429/503), at most once per
+    window: responses to requests sent before the last cut are ignored, so one
+    burst counts once. It climbs back by roughly one slot per limit's worth of
+    successes (2xx or 304), never above ``max_limit``. Unlike a Semaphore, the
+    cap can shrink while requests are in flight; excess requests simply wait
+    until enough have finished.
+    """
+
+    __slots__ = ("max_limit", "epoch", "_limit", "_in_flight", "_condition")
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        # Bumped on every decrease; callers read it before sending a request.
+        self.epoch = 0
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def _has_capacity(self) -> bool:
+        return self._in_flight < int(self._limit)
+
+    def record(self, status_code: int, epoch: int) -> None:
+        # Called while holding a slot; waiters are woken on release.
+        if status_code in OVERLOAD_STATUS_CODES:
+            if epoch == self.epoch:
+                self._limit = max(1.0, self._limit / 2)
+                self.epoch += 1
+        elif (
+            200 <= status_code < 300 or status_code == 304
+        ) and self._limit < self.max_limit:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            try:
+                await self._condition.wait_for(self._has_capacity)
+            except asyncio.CancelledError:
+                # We may have been woken for a free slot; hand it to the next waiter.
+                if self._has_capacity():
+                    self._condition.notify(1)
+                raise
+            self._in_flight += 1
+
+    async def _wake_waiters(self) -> None:
+        async with self._condition:
+            # The limit may have grown meanwhile; wake one waiter per free slot.
+            self._condition.notify(max(1, int(self._limit) - self._in_flight))
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        # Free the slot before any await so a cancellation here cannot leak it.
+        self._in_flight -= 1
+        if self._condition.locked():
+            # Waiting for the lock can be cancelled; finish the wake-up anyway.
+            await asyncio.shield(self._wake_waiters())
+        else:
+            # An unlocked Lock is acquired without suspending, so no cancel point.
+            await self._wake_waiters()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    # Plain function: creation never awaits, so no lock or coroutine is needed.
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    # Replace a client closed out from under us instead of failing every call.
+    if client is None or client.is_closed:
+        pool_size = _config().pool_size
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                HTTP_TIMEOUT_SECONDS,
+                connect=HTTP_CONNECT_TIMEOUT_SECONDS,
+            ),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=True,
+        )
+        _http_clients[loop] = client
+        # Reopening keeps the loop's adaptive limit; in-flight slots stay valid.
+        _request_slots.setdefault(loop, _AdmissionController(pool_size))
+    return client
+
+
+def _get_request_slots() -> _AdmissionController:
+    _get_http_client()
+    return _request_slots[asyncio.get_running_loop()]
+
+
+def _get_global_limiter() -> _RedisConcurrencyLimiter | None:
+    config = _config()
+    if not config.redis_url:
+        return None
+    loop = asyncio.get_running_loop()
+    limiter = _global_limiters.get(loop)
+    if limiter is None:
+        limiter = _create_redis_limiter(
+            config.redis_url,
+            _fred_api_key(),
+            config.global_max_in_flight,
+        )
+        _global_limiters[loop] = limiter
+    return limiter
+
+
+async def _close_http_client() -> None:
+    loop = asyncio.get_running_loop()
+    _request_slots.pop(loop, None)
+    client = _http_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+    limiter = _global_limiters.pop(loop, None)
+    if limiter is not None:
+        await limiter.aclose()
+
+
+def _cooldown_remaining() -> float:
+    return _cooldown_until - time.monotonic()
+
+
+def _extend_cooldown(delay: float) -> None:
+    global _cooldown_until
+    _cooldown_until = max(_cooldown_until, time.monotonic() + delay)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    # Retry-After is either delay-seconds or an HTTP-date (RFC 9110).
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return seconds if math.isfinite(seconds) else None
 
 
 def _retry_delay_seconds(
     attempt: int,
     response: httpx.Response | None = None,
 ) -> float:
+    base = min(BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)), BACKOFF_MAX_SECONDS)
+    # Jitter keeps concurrent retriers from waking in lockstep after a 429/503.
+    delay = _retry_rng.uniform(base * 0.5, base * 1.5)
     if response is not None:
         retry_after = response.headers.get("Retry-After")
         if retry_after is not None:
-            try:
-                parsed_retry_after = float(retry_after)
-                return max(0.0, min(parsed_retry_after, BACKOFF_MAX_SECONDS))
-            except ValueError:
-                pass
-    return min(BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)), BACKOFF_MAX_SECONDS)
+            parsed_retry_after = _parse_retry_after(retry_after)
+            if parsed_retry_after is not None:
+                # Never retry sooner than the server asked, nor sooner than backoff.
+                delay = max(delay, parsed_retry_after)
+    return min(delay, BACKOFF_MAX_SECONDS)
 
 
-async def _http_get_json(
+@dataclass(slots=True)
+class _UpstreamFailure:
+    code: str
+    message: str
+    failure_log: str
+    retry_log: str = ""
+    retryable: bool = False
+    status_code: int | None = None
+    response: httpx.Response | None = None
+    network_error: httpx.RequestError | None = None
+    decode_reason: str | None = None
+
+
+def _http_status_failure(response: httpx.Response) -> _UpstreamFailure:
+    status_code = response.status_code
+    return _UpstreamFailure(
+        code="upstream_http_error",
+        message=f"Upstream request failed with status {status_code}",
+        failure_log="Upstream HTTP request failed",
+        retry_log="Retrying upstream HTTP error",
+        retryable=status_code in RETRYABLE_STATUS_CODES,
+        status_code=status_code,
+        response=response,
+    )
+
+
+def _classify_upstream_failure(exc: Exception) -> _UpstreamFailure:
+    if isinstance(exc, httpx.RequestError):
+        return _UpstreamFailure(
+            code="upstream_network_error",
+            message="Network error while contacting upstream API",
+            failure_log="Upstream network request failed",
+            retry_log="Retrying upstream network error",
+            retryable=True,
+            network_error=exc,
+        )
+    return _UpstreamFailure(
+        code="upstream_invalid_json",
+        message="Failed to decode upstream JSON response",
+        failure_log="Upstream response JSON decode failed",
+        decode_reason=str(exc),
+    )
+
+
+def _log_upstream_failure(
+    level: int,
+    message: str,
+    failure: _UpstreamFailure,
+    *,
+    base_url: str,
+    endpoint: str,
+    attempt: int,
+    query: dict[str, Any],
+    delay: float | None = None,
+) -> None:
+    if not logger.isEnabledFor(level):
+        return
+    extra: dict[str, Any] = {
+        "base_url": base_url,
+        "endpoint": endpoint,
+        "attempt": attempt,
+        "query": _sanitize_log_params(query),
+    }
+    if failure.status_code is not None:
+        extra["status_code"] = failure.status_code
+    if delay is not None:
+        extra["delay_seconds"] = delay
+    else:
+        extra["retryable"] = failure.retryable
+    if failure.network_error is not None:
+        extra["reason"] = _redact_api_key_text(str(failure.network_error))
+    logger.log(level, message, extra=extra)
+
+
+def _decode_json_object(body: bytes) -> dict[str, Any] | None:
+    # Decode the buffered body in one orjson pass. FRED caps page sizes,
+    # so a single C parse beats incremental (ijson-style) decoding.
+    payload = orjson.loads(body)
+    return payload if isinstance(payload, dict) else None
+
+
+def _json_object_bytes(body: bytes) -> bytes | None:
+    # Shape check only; the document is never materialized.
+    return body if _JSON_OBJECT_PREFIX_RE.match(body) else None
+
+
+@dataclass(slots=True)
+class _UpstreamRequest:
+    base_url: str
+    endpoint: str
+    url: str
+    query: dict[str, Any]
+    query_items: tuple[tuple[str, str | int], ...] | None
+    headers: dict[str, str] | None
+    parse_body: Callable[[bytes], Any]
+    cache_key: tuple[Any, ...] | None
+    validator_key: tuple[Any, ...] | None
+
+
+def _forget_inflight(key: tuple[Any, ...], task: "asyncio.Task[Any]") -> None:
+    _inflight_requests.pop(key, None)
+    if not task.cancelled():
+        # Mark the exception retrieved even if every waiter was cancelled.
+        task.exception()
+
+
+async def _http_get(
     base_url: str,
     endpoint: str,
     params: dict[str, Any],
+    parse_body: Callable[[bytes], _T | None],
     headers: dict[str, str] | None = None,
     include_api_key_query: bool = True,
-) -> dict[str, Any]:
-    query = _clean_params(params)
-    if include_api_key_query:
-        query["api_key"] = _fred_api_key()
-    query["file_type"] = "json"
-    normalized_endpoint = endpoint.strip("/")
-    url = f"{base_url}/{normalized_endpoint}"
-    safe_query = _sanitize_log_params(query)
-    client = await _get_http_client()
+) -> _T:
+    query = _prepare_query(
+        params,
+        _fred_api_key() if include_api_key_query else None,
+    )
+    url, normalized_endpoint = _resolve_endpoint_url(base_url, endpoint)
+    query_items = _query_items(query)
+    cache_key = _response_cache_key(parse_body, url, normalized_endpoint, query_items)
+    if cache_key is not None:
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            return cached
+    request = _UpstreamRequest(
+        base_url=base_url,
+        endpoint=normalized_endpoint,
+        url=url,
+        query=query,
+        query_items=query_items,
+        headers=headers,
+        parse_body=parse_body,
+        cache_key=cache_key,
+        # Revalidation is safe for time-sensitive endpoints too.
+        validator_key=None if query_items is None else (parse_body, url, query_items),
+    )
+    if query_items is None:
+        return await _fetch_with_retries(request)
+
+    flight_key = (
+        asyncio.get_running_loop(),
+        parse_body,
+        url,
+        query_items,
+        tuple(sorted(headers.items())) if headers else (),
+    )
+    task = _inflight_requests.get(flight_key)
+    if task is None:
+        task = asyncio.create_task(_fetch_with_retries(request))
+        _inflight_requests[flight_key] = task
+        task.add_done_callback(functools.partial(_forget_inflight, flight_key))
+    # Shield so one cancelled caller does not cancel the fetch for the others.
+    return await asyncio.shield(task)
+
+
+async def _fetch_with_retries(request: _UpstreamRequest) -> Any:
+    request_url: httpx.URL | str = request.url
+    request_params: dict[str, Any] | None = request.query
+    if request.query_items is not None:
+        request_url = _build_request_url(request.url, request.query_items)
+        request_params = None
+    validators = None
+    if request.validator_key is not None:
+        validators = _validator_cache.get(request.validator_key)
+    request_headers = _conditional_headers(request.headers, validators)
+    client = _get_http_client()
+    request_slots = _get_request_slots()
+    global_limiter = _get_global_limiter()
+    global_slot = (
+        global_limiter.slot if global_limiter is not None else contextlib.nullcontext
+    )
     max_attempts = HTTP_MAX_RETRIES + 1
 
     # Retry transient upstream failures with exponential backoff.
+    # Don't pile onto an upstream that other requests are already backing off from.
+    cooldown = _cooldown_remaining()
+    if cooldown > 0:
+        await asyncio.sleep(cooldown)
+
     for attempt in range(1, max_attempts + 1):
+        cause: Exception | None = None
         try:
-            response = await client.get(url, params=query, headers=headers)
-            response.raise_for_status()
-            payload = response.json()
-            if not isinstance(payload, dict):
-                raise FredServerError(
-                    _error_payload(
-                        "Upstream response was not a JSON object",
-                        code="upstream_invalid_payload",
-                        error_type="upstream_invalid_payload",
-                        base_url=base_url,
-                        endpoint=normalized_endpoint,
-                        details={"attempt": attempt},
-                    )
+            # Queue here rather than inside httpx so excess load is shed in order.
+            async with request_slots, global_slot():
+                epoch = request_slots.epoch
+                response = await client.get(
+                    request_url,
+                    params=request_params,
+                    headers=request_headers,
                 )
-            return payload
+                request_slots.record(response.status_code, epoch)
+            if response.status_code == 304 and validators is not None:
+                # Unchanged upstream: reuse the stored payload, no body to decode.
+                _validator_cache.move_to_end(request.validator_key)
+                payload = validators[2]
+                if request.cache_key is not None:
+                    _response_cache_put(
+                        request.cache_key,
+                        payload,
+                        _response_ttl(request.endpoint, response),
+                    )
+                return payload
+            if response.is_success:
+                payload = request.parse_body(response.content)
+                if payload is None:
+                    raise FredServerError(
+                        _error_payload(
+                            "Upstream response was not a JSON object",
+                            code="upstream_invalid_payload",
+                            error_type="upstream_invalid_payload",
+                            base_url=request.base_url,
+                            endpoint=request.endpoint,
+                            details={"attempt": attempt},
+                        )
+                    )
+                if request.cache_key is not None:
+                    _response_cache_put(
+                        request.cache_key,
+                        payload,
+                        _response_ttl(request.endpoint, response),
+                    )
+                if request.validator_key is not None:
+                    _validator_cache_put(request.validator_key, response, payload)
+                return payload
+            # Classify error statuses directly instead of raising and catching.
+            failure = _http_status_failure(response)
         except asyncio.CancelledError:
             raise
-        except httpx.HTTPStatusError as exc:
-            status_code = exc.response.status_code
-            retryable = status_code in RETRYABLE_STATUS_CODES
-            if retryable and attempt < max_attempts:
-                delay = _retry_delay_seconds(attempt, exc.response)
-                logger.warning(
-                    "Retrying upstream HTTP error",
-                    extra={
-                        "base_url": base_url,
-                        "endpoint": normalized_endpoint,
-                        "status_code": status_code,
-                        "attempt": attempt,
-                        "delay_seconds": delay,
-                        "query": safe_query,
-                    },
-                )
-                await asyncio.sleep(delay)
-                continue
-            logger.error(
-                "Upstream HTTP request failed",
-                extra={
-                    "base_url": base_url,
-                    "endpoint": normalized_endpoint,
-                    "status_code": status_code,
-                    "retryable": retryable,
-                    "attempt": attempt,
-                    "query": safe_query,
-                },
-            )
-            raise FredServerError(
-                _error_payload(
-                    f"Upstream request failed with status {status_code}",
-                    code="upstream_http_error",
-                    error_type="upstream_http_error",
-                    base_url=base_url,
-                    endpoint=normalized_endpoint,
-                    status_code=status_code,
-                    retryable=retryable,
-                    details={"attempt": attempt},
-                )
-            ) from exc
-        except httpx.RequestError as exc:
-            redacted_reason = _redact_api_key_text(str(exc))
-            if attempt < max_attempts:
-                delay = _retry_delay_seconds(attempt)
-                logger.warning(
-                    "Retrying upstream network error",
-                    extra={
-                        "base_url": base_url,
-                        "endpoint": normalized_endpoint,
-                        "attempt": attempt,
-                        "delay_seconds": delay,
-                        "query": safe_query,
-                        "reason": redacted_reason,
-                    },
-                )
-                await asyncio.sleep(delay)
-                continue
-            logger.error(
-                "Upstream network request failed",
-                extra={
-                    "base_url": base_url,
-                    "endpoint": normalized_endpoint,
-                    "attempt": attempt,
-                    "query": safe_query,
-                    "reason": redacted_reason,
-                },
+        except (httpx.RequestError, ValueError) as exc:
+            failure = _classify_upstream_failure(exc)
+            cause = exc
+
+        log_context = {
+            "base_url": request.base_url,
+            "endpoint": request.endpoint,
+            "attempt": attempt,
+            "query": request.query,
+        }
+        if failure.retryable and attempt < max_attempts:
+            delay = _retry_delay_seconds(attempt, failure.response)
+            if failure.status_code in OVERLOAD_STATUS_CODES:
+                _extend_cooldown(delay)
+            # One sleep covers both this request's backoff and any shared cooldown.
+            delay = max(delay, _cooldown_remaining())
+            _log_upstream_failure(
+                logging.WARNING,
+                failure.retry_log,
+                failure,
+                delay=delay,
+                **log_context,
             )
-            raise FredServerError(
-                _error_payload(
-                    "Network error while contacting upstream API",
-                    code="upstream_network_error",
-                    error_type="upstream_network_error",
-                    base_url=base_url,
-                    endpoint=normalized_endpoint,
-                    retryable=True,
-                    details={"attempt": attempt},
-                )
-            ) from exc
-        except ValueError as exc:
-            logger.error(
-                "Upstream response JSON decode failed",
-                extra={
-                    "base_url": base_url,
-                    "endpoint": normalized_endpoint,
-                    "attempt": attempt,
-                    "query": safe_query,
-                },
+            await asyncio.sleep(delay)
+            continue
+        _log_upstream_failure(
+            logging.ERROR,
+            failure.failure_log,
+            failure,
+            **log_context,
+        )
+        details: dict[str, Any] = {"attempt": attempt}
+        if failure.decode_reason is not None:
+            details["reason"] = failure.decode_reason
+        raise FredServerError(
+            _error_payload(
+                failure.message,
+                code=failure.code,
+                error_type=failure.code,
+                base_url=request.base_url,
+                endpoint=request.endpoint,
+                status_code=failure.status_code,
+                retryable=failure.retryable,
+                details=details,
             )
-            raise FredServerError(
-                _error_payload(
-                    "Failed to decode upstream JSON response",
-                    code="upstream_invalid_json",
-                    error_type="upstream_invalid_json",
-                    base_url=base_url,
-                    endpoint=normalized_endpoint,
-                    details={"attempt": attempt, "reason": str(exc)},
-                )
-            ) from exc
+        ) from cause
+
+
+async def _http_get_json(
+    base_url: str,
+    endpoint: str,
+    params: dict[str, Any],
+    headers: dict[str, str] | None = None,
+    include_api_key_query: bool = True,
+) -> dict[str, Any]:
+    return await _http_get(
+        base_url,
+        endpoint,
+        params,
+        _decode_json_object,
+        headers=headers,
+        include_api_key_query=include_api_key_query,
+    )
+
+
+async def _http_get_raw(
+    base_url: str,
+    endpoint: str,
+    params: dict[str, Any],
+    headers: dict[str, str] | None = None,
+    include_api_key_query: bool = True,
+) -> bytes:
+    # For pass-through callers: skip the decode/re-encode round trip entirely.
+    return await _http_get(
+        base_url,
+        endpoint,
+        params,
+        _json_object_bytes,
+        headers=headers,
+        include_api_key_query=include_api_key_query,
+    )
 
 
 async def _fred_get(endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
     return await _http_get_json(FRED_API_BASE, endpoint, params)
 
 
+async def _fred_get_many(
+    requests: list[tuple[str, dict[str, Any]]],
+    concurrency: int = 16,
+) -> list[dict[str, Any]]:
+    # Fan out over the shared pooled (HTTP/2) client; results keep input order.
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            return await _fred_get(endpoint, params)
+
+    return await asyncio.gather(
+        *(_one(endpoint, params) for endpoint, params in requests)
+    )
+
+
 async def _geofred_get(endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
     return await _http_get_json(GEOFRED_API_BASE, endpoint, params)
 
 
+@functools.lru_cache(maxsize=1)
+def _v2_auth_headers(api_key: str) -> dict[str, str]:
+    # Shared across calls; nothing downstream mutates request headers.
+    return {"api_key": api_key}
+
+
 async def _fred_v2_get(endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
     return await _http_get_json(
         FRED_V2_API_BASE,
         endpoint,
         params,
-        headers={"api_key": _fred_api_key()},
+        headers=_v2_auth_headers(_fred_api_key()),
         include_api_key_query=False,
     )
@@ -24,13 +24,14 @@ def _error_payload(
     details: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     # Keep top-level "error" for backwards compatibility with existing clients.
+    # Callers pass endpoints already normalized (no leading/trailing "/").
     return {
         "error": message,
         "error_details": {
             "type": error_type,
             "code": code,
             "base_url": base_url,
-            "endpoint": endpoint.strip("/") if endpoint else None,
+            "endpoint": endpoint or None,
             "status_code": status_code,
             "retryable": retryable,
             "details": details or {},
@@ -56,7 +57,14 @@ def _tool_error_boundary(
                 error_type="validation_error",
             )
         except Exception as exc:
-            logger.exception("Unhandled tool error in '%s'", func.__name__)
+            # Tracebacks are costly to format; only attach them when debugging.
+            logger.error(
+                "Unhandled tool error in '%s' (%s: %s)",
+                func.__name__,
+                type(exc).__name__,
+                exc,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             return _error_payload(
                 "Internal server error",
                 code="internal_error",
@@ -0,0 +1,120 @@
+import asyncio
+import contextlib
+import hashlib
+import logging
+import secrets
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from .errors import FredServerError, _error_payload
+
+logger = logging.getLogger(__name__)
+
+# Members older than this are treated as leaked by a crashed worker.
+LIMITER_WINDOW_SECONDS = 60
+LIMITER_KEY_PREFIX = "fred-mcp:inflight:"
+# Redis sits on every upstream attempt; a slow or dead server must not stall it.
+LIMITER_TIMEOUT_SECONDS = 0.25
+
+
+class _RedisConcurrencyLimiter:
+    """Cross-process cap on in-flight upstream requests, backed by a sorted set.
+
+    Each request adds a random member scored by its start time, counts the
+    set, and backs out if that puts it over the cap. Stale members are pruned
+    on every acquire. Redis errors and calls slower than
+    ``LIMITER_TIMEOUT_SECONDS`` fail open, so an outage never blocks tools.
+    """
+
+    __slots__ = ("max_in_flight", "_redis", "_key", "_redis_error")
+
+    def __init__(
+        self,
+        redis: Any,
+        key: str,
+        max_in_flight: int,
+        redis_error: type[Exception],
+    ):
+        self.max_in_flight = max_in_flight
+        self._redis = redis
+        self._key = key
+        self._redis_error = redis_error
+
+    async def acquire(self) -> str | None:
+        """Return a request id holding a slot, or None when the cap is reached."""
+        request_id = secrets.token_hex(8)
+        now = time.time()
+        try:
+            async with asyncio.timeout(LIMITER_TIMEOUT_SECONDS):
+                async with self._redis.pipeline(transaction=True) as pipe:
+                    pipe.zremrangebyscore(self._key, 0, now - LIMITER_WINDOW_SECONDS)
+                    pipe.zadd(self._key, {request_id: now})
+                    pipe.zcard(self._key)
+                    pipe.expire(self._key, LIMITER_WINDOW_SECONDS)
+                    _, _, in_flight, _ = await pipe.execute()
+                if in_flight > self.max_in_flight:
+                    await self._redis.zrem(self._key, request_id)
+                    return None
+        except (self._redis_error, TimeoutError) as exc:
+            logger.warning(
+                "Redis request limiter unavailable; allowing request (%s)",
+                type(exc).__name__,
+            )
+        return request_id
+
+    async def release(self, request_id: str) -> None:
+        try:
+            async with asyncio.timeout(LIMITER_TIMEOUT_SECONDS):
+                await self._redis.zrem(self._key, request_id)
+        except (self._redis_error, TimeoutError):
+            # The window prunes the member eventually.
+            logger.debug("Failed to release Redis limiter slot", exc_info=True)
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        request_id = await self.acquire()
+        if request_id is None:
+            raise FredServerError(
+                _error_payload(
+                    "Too many concurrent upstream requests across workers",
+                    code="rate_limited",
+                    error_type="rate_limited",
+                    retryable=True,
+                    details={"max_in_flight": self.max_in_flight},
+                )
+            )
+        try:
+            yield
+        finally:
+            await self.release(request_id)
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+def _create_redis_limiter(
+    url: str,
+    api_key: str,
+    max_in_flight: int,
+) -> _RedisConcurrencyLimiter:
+    try:
+        import redis.asyncio as redis_asyncio
+        from redis.exceptions import RedisError
+    except ImportError as exc:
+        raise ImportError(
+            "REDIS_URL is set but redis is not installed; install fred-mcp[redis]"
+        ) from exc
+
+    # FRED limits are per API key; hash it so the key never lands in Redis.
+    digest = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    return _RedisConcurrencyLimiter(
+        redis_asyncio.from_url(
+            url,
+            socket_connect_timeout=LIMITER_TIMEOUT_SECONDS,
+            socket_timeout=LIMITER_TIMEOUT_SECONDS,
+        ),
+        LIMITER_KEY_PREFIX + digest,
+        max_in_flight,
+        RedisError,
+    )
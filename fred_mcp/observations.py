@@ -0,0 +1,95 @@
+import base64
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# FRED marks missing observation values with a literal ".".
+MISSING_VALUE = "."
+
+# Maps the sentinel to None; every other value falls through .get unchanged.
+_MISSING_TO_NONE = {MISSING_VALUE: None}
+
+
+def _clean_observations(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    # One lookup per field; FRED's missing-value sentinel becomes None.
+    missing_to_none = _MISSING_TO_NONE.get
+    return [
+        {"date": row.get("date"), "value": missing_to_none(value, value)}
+        for row in rows
+        for value in (row.get("value"),)
+    ]
+
+
+def _observation_columns(
+    rows: Iterable[dict[str, Any]],
+) -> dict[str, list[Any]]:
+    # Columnar form: two flat lists instead of one small dict per row.
+    missing_to_none = _MISSING_TO_NONE.get
+    dates: list[Any] = []
+    values: list[Any] = []
+    add_date = dates.append
+    add_value = values.append
+    for row in rows:
+        get = row.get
+        add_date(get("date"))
+        value = get("value")
+        add_value(missing_to_none(value, value))
+    return {"date": dates, "value": values}
+
+
+def _encode_observation_cursor(last_date: str, sort_order: str) -> str:
+    # Keyset cursor: resume strictly after the last date already returned.
+    raw = orjson.dumps({"after": last_date, "sort": sort_order})
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_observation_cursor(cursor: str) -> tuple[str, str]:
+    """Return ``(sort_order, next_date)`` for a cursor from get_observations.
+
+    ``next_date`` is the first date still to be returned in that sort order,
+    ready to pass as ``observation_start`` (asc) or ``observation_end`` (desc).
+    """
+    try:
+        state = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        after = date.fromisoformat(state["after"])
+        sort_order = state["sort"]
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Invalid observations cursor") from None
+    if sort_order == "asc":
+        return sort_order, (after + timedelta(days=1)).isoformat()
+    if sort_order == "desc":
+        return sort_order, (after - timedelta(days=1)).isoformat()
+    raise ValueError("Invalid observations cursor")
+
+
+def _observations_to_arrays(
+    payload: dict[str, Any],
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Convert a series/observations payload into (dates, values) NumPy arrays.
+
+    Dates are ``datetime64[D]`` and values are ``float64`` with NaN for missing
+    observations. Requires the optional ``arrays`` extra (NumPy).
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError(
+            "NumPy is required for array observations; install fred-mcp[arrays]"
+        ) from exc
+
+    observations = payload.get("observations") or ()
+    dates = np.array([row["date"] for row in observations], dtype="datetime64[D]")
+    # One pass swaps the sentinel for "nan"; NumPy then parses all values in C.
+    values = np.array(
+        [
+            "nan" if (value := row["value"]) == MISSING_VALUE else value
+            for row in observations
+        ],
+        dtype=np.float64,
+    )
+    return dates, values
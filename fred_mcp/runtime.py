@@ -1,6 +1,21 @@
+import asyncio
+import sys
+
 from .app import mcp
 from . import tools as _tools  # noqa: F401
 
 
+def _install_uvloop() -> None:
+    # Optional speedup (fred-mcp[speedups]); the stdlib loop is used otherwise.
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main() -> None:
+    _install_uvloop()
     mcp.run(transport="stdio")
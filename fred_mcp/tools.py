@@ -1,8 +1,15 @@
+import asyncio
 from typing import Any
 
 from .app import mcp
 from .client import _fred_get, _fred_v2_get, _geofred_get, _parse_json_object
 from .errors import _error_payload, _tool_error_boundary
+from .observations import (
+    _clean_observations,
+    _decode_observation_cursor,
+    _encode_observation_cursor,
+    _observation_columns,
+)
 from .validation import (
     _normalize_limit,
     _normalize_offset,
@@ -10,6 +17,9 @@ from .validation import (
     _normalize_sort_order,
 )
 
+# Shared default for absent list fields; results are only iterated or measured.
+_EMPTY: tuple[Any, ...] = ()
+
 
 def _compact_series_row(row: dict[str, Any]) -> dict[str, Any]:
     return {
@@ -71,7 +81,7 @@ async def get_category(
             "realtime_end": realtime_end,
         },
     )
-    categories = data.get("categories", [])
+    categories = data.get("categories") or _EMPTY
     if not categories:
         return _error_payload(
             f"Category '{category_id}' not found",
@@ -150,7 +160,9 @@ async def get_category_series(
             "realtime_end": realtime_end,
         },
     )
-    series_rows = [_compact_series_row(row) for row in data.get("seriess", [])]
+    series_rows = [
+        _compact_series_row(row) for row in data.get("seriess") or _EMPTY
+    ]
     return {
         "category_id": category_id,
         "count": data.get("count", len(series_rows)),
@@ -238,6 +250,7 @@ async def get_releases(
     sort_order: str = "desc",
     realtime_start: str | None = None,
     realtime_end: str | None = None,
+    compact: bool = True,
 ) -> dict[str, Any]:
     """fred/releases"""
     data = await _fred_get(
@@ -251,15 +264,17 @@ async def get_releases(
             "realtime_end": realtime_end,
         },
     )
-    releases = [
-        {
-            "id": release.get("id"),
-            "name": release.get("name"),
-            "press_release": release.get("press_release"),
-            "link": release.get("link"),
-        }
-        for release in data.get("releases", [])
-    ]
+    releases = data.get("releases") or _EMPTY
+    if compact:
+        releases = [
+            {
+                "id": release.get("id"),
+                "name": release.get("name"),
+                "press_release": release.get("press_release"),
+                "link": release.get("link"),
+            }
+            for release in releases
+        ]
     return {
         "count": data.get("count", len(releases)),
         "offset": data.get("offset", offset),
@@ -367,7 +382,9 @@ async def get_release_series(
             "realtime_end": realtime_end,
         },
     )
-    series_rows = [_compact_series_row(row) for row in data.get("seriess", [])]
+    series_rows = [
+        _compact_series_row(row) for row in data.get("seriess") or _EMPTY
+    ]
     return {
         "release_id": release_id,
         "count": data.get("count", len(series_rows)),
@@ -500,7 +517,7 @@ async def get_series(
             "realtime_end": realtime_end,
         },
     )
-    rows = data.get("seriess", [])
+    rows = data.get("seriess") or _EMPTY
     if not rows:
         return _error_payload(
             f"Series '{series_id}' not found",
@@ -545,17 +562,57 @@ async def get_observations(
     aggregation_method: str | None = None,
     output_type: int | None = None,
     vintage_dates: str | None = None,
+    cursor: str | None = None,
+    columnar: bool = False,
 ) -> dict[str, Any]:
-    """fred/series/observations"""
+    """fred/series/observations
+
+    Pass ``next_cursor`` from a previous result as ``cursor`` to fetch the next
+    page by date range instead of by offset. Cursors are not offered with
+    ``realtime_start``/``realtime_end``/``vintage_dates``/``output_type``, which
+    can return several rows per date, nor with ``frequency``/
+    ``aggregation_method``, whose dates label whole periods; page those by
+    offset. Set ``columnar`` to get
+    ``observations`` as parallel ``date``/``value`` lists, which is much
+    smaller than one object per row on large pulls.
+    """
+    limit = _normalize_limit(limit, 1, 100000)
+    sort_order = _normalize_sort_order(sort_order)
+    # Date keysets need one row per observation date; vintage/real-time views
+    # repeat dates and frequency aggregation labels periods by their start.
+    keyset_paging = all(
+        option is None
+        for option in (
+            realtime_start,
+            realtime_end,
+            vintage_dates,
+            output_type,
+            frequency,
+            aggregation_method,
+        )
+    )
+    if cursor is not None:
+        if not keyset_paging:
+            raise ValueError(
+                "cursor cannot be combined with realtime_start, realtime_end, "
+                "vintage_dates, output_type, frequency or aggregation_method; "
+                "page with offset instead"
+            )
+        sort_order, next_date = _decode_observation_cursor(cursor)
+        offset = 0
+        if sort_order == "asc":
+            observation_start = next_date
+        else:
+            observation_end = next_date
     data = await _fred_get(
         "series/observations",
         {
             "series_id": series_id,
             "realtime_start": realtime_start,
             "realtime_end": realtime_end,
-            "limit": _normalize_limit(limit, 1, 100000),
+            "limit": limit,
             "offset": _normalize_offset(offset),
-            "sort_order": _normalize_sort_order(sort_order),
+            "sort_order": sort_order,
             "observation_start": observation_start,
             "observation_end": observation_end,
             "units": units,
@@ -565,16 +622,19 @@ async def get_observations(
             "vintage_dates": vintage_dates,
         },
     )
-    observations = data.get("observations", [])
-    cleaned = [
-        {"date": row.get("date"), "value": None if row.get("value") == "." else row.get("value")}
-        for row in observations
-    ]
+    rows = data.get("observations") or _EMPTY
+    next_cursor = None
+    # A short page means the range is exhausted.
+    if keyset_paging and len(rows) == limit and (last_date := rows[-1].get("date")):
+        next_cursor = _encode_observation_cursor(last_date, sort_order)
     return {
         "series_id": series_id,
-        "count": len(cleaned),
+        "count": len(rows),
         "offset": data.get("offset", offset),
-        "observations": cleaned,
+        "observations": (
+            _observation_columns(rows) if columnar else _clean_observations(rows)
+        ),
+        "next_cursor": next_cursor,
     }
 
 
@@ -594,6 +654,8 @@ async def get_series_observations(
     aggregation_method: str | None = None,
     output_type: int | None = None,
     vintage_dates: str | None = None,
+    cursor: str | None = None,
+    columnar: bool = False,
 ) -> dict[str, Any]:
     """Alias for get_observations."""
     return await get_observations(
@@ -610,9 +672,32 @@ async def get_series_observations(
         aggregation_method=aggregation_method,
         output_type=output_type,
         vintage_dates=vintage_dates,
+        cursor=cursor,
+        columnar=columnar,
     )
 
 
+@mcp.tool()
+@_tool_error_boundary
+async def get_series_bundle(
+    series_id: str,
+    limit: int = 1000,
+    sort_order: str = "desc",
+) -> dict[str, Any]:
+    """Series metadata, categories, and observations fetched concurrently."""
+    # Each sub-tool has its own error boundary, so one failure does not sink the rest.
+    series, categories, observations = await asyncio.gather(
+        get_series(series_id),
+        get_series_categories(series_id),
+        get_observations(series_id, limit=limit, sort_order=sort_order),
+    )
+    return {
+        "series": series,
+        "categories": categories,
+        "observations": observations,
+    }
+
+
 @mcp.tool()
 @_tool_error_boundary
 async def get_series_release(
@@ -665,7 +750,9 @@ async def search_series(
             "realtime_end": realtime_end,
         },
     )
-    series_rows = [_compact_series_row(row) for row in data.get("seriess", [])]
+    series_rows = [
+        _compact_series_row(row) for row in data.get("seriess") or _EMPTY
+    ]
     return {
         "count": data.get("count", len(series_rows)),
         "offset": data.get("offset", offset),
@@ -985,7 +1072,9 @@ async def get_tag_series(
             "sort_order": _normalize_sort_order(sort_order),
         },
     )
-    series_rows = [_compact_series_row(row) for row in data.get("seriess", [])]
+    series_rows = [
+        _compact_series_row(row) for row in data.get("seriess") or _EMPTY
+    ]
     return {
         "count": data.get("count", len(series_rows)),
         "offset": data.get("offset", offset),
@@ -1070,7 +1159,11 @@ async def get_release_observations_v2(
     sort_order: str = "desc",
     next_cursor: str | None = None,
 ) -> dict[str, Any]:
-    """fred/v2/release/observations"""
+    """fred/v2/release/observations
+
+    Pass ``next_cursor`` from the previous response to continue paging; it
+    replaces ``offset``, which is then not sent.
+    """
     return await _fred_v2_get(
         "release/observations",
         {
@@ -1078,7 +1171,7 @@ async def get_release_observations_v2(
             "date": date,
             "series_id": series_id,
             "limit": _normalize_limit(limit, 1, 500000),
-            "offset": _normalize_offset(offset),
+            "offset": None if next_cursor is not None else _normalize_offset(offset),
             "sort_order": _normalize_sort_order(sort_order),
             "next_cursor": next_cursor,
         },
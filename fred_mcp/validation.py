@@ -1,13 +1,15 @@
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
-RELEASE_ORDER_BY_VALUES = {
+RELEASE_ORDER_BY_VALUES = frozenset({
     "release_id",
     "name",
     "press_release",
     "realtime_start",
     "realtime_end",
-}
-SERIES_ORDER_BY_VALUES = {
+})
+SERIES_ORDER_BY_VALUES = frozenset({
     "series_id",
     "title",
     "units",
@@ -20,12 +22,19 @@ SERIES_ORDER_BY_VALUES = {
     "observation_end",
     "popularity",
     "group_popularity",
-}
+})
 SEARCH_SERIES_ORDER_BY_VALUES = SERIES_ORDER_BY_VALUES | {"search_rank"}
-TAGS_ORDER_BY_VALUES = {"series_count", "popularity", "created", "name", "group_id"}
-SOURCES_ORDER_BY_VALUES = {"source_id", "name", "realtime_start", "realtime_end"}
-
-ORDER_BY_RULES: dict[str, tuple[str, set[str]]] = {
+TAGS_ORDER_BY_VALUES = frozenset(
+    {"series_count", "popularity", "created", "name", "group_id"}
+)
+SOURCES_ORDER_BY_VALUES = frozenset({"source_id", "name", "realtime_start", "realtime_end"})
+SORT_ORDER_VALUES = frozenset({"asc", "desc"})
+# Common spellings resolve with one lookup; anything else is normalized.
+_SORT_ORDER_ALIASES: Mapping[str, str] = MappingProxyType(
+    {"asc": "asc", "desc": "desc", "ASC": "asc", "DESC": "desc"}
+)
+
+ORDER_BY_RULES: Mapping[str, tuple[str, frozenset[str]]] = MappingProxyType({
     "category/series": ("popularity", SERIES_ORDER_BY_VALUES),
     "category/tags": ("series_count", TAGS_ORDER_BY_VALUES),
     "category/related_tags": ("series_count", TAGS_ORDER_BY_VALUES),
@@ -42,44 +51,47 @@ ORDER_BY_RULES: dict[str, tuple[str, set[str]]] = {
     "tags": ("series_count", TAGS_ORDER_BY_VALUES),
     "related_tags": ("series_count", TAGS_ORDER_BY_VALUES),
     "tags/series": ("popularity", SERIES_ORDER_BY_VALUES),
-}
-
-
-def _clamp(value: int, low: int, high: int) -> int:
-    return max(low, min(value, high))
-
-
-def _non_negative(value: int) -> int:
-    return max(0, value)
+})
 
 
 def _normalize_limit(value: int, low: int, high: int) -> int:
-    try:
-        parsed = int(value)
-    except (TypeError, ValueError):
-        parsed = low
-    return _clamp(parsed, low, high)
+    # Tools nearly always receive a real int; skip the int() round-trip then.
+    if type(value) is not int:
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return low
+    return low if value < low else high if value > high else value
 
 
 def _normalize_offset(value: int) -> int:
-    try:
-        parsed = int(value)
-    except (TypeError, ValueError):
-        parsed = 0
-    return _non_negative(parsed)
-
-
-def _normalize_enum(value: Any, valid: set[str], default: str) -> str:
+    if type(value) is not int:
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return 0
+    return value if value > 0 else 0
+
+
+def _normalize_enum(value: Any, valid: frozenset[str], default: str) -> str:
+    # Fast path: most callers pass an already-canonical value.
+    if isinstance(value, str) and value in valid:
+        return value
     candidate = str(value).strip().lower() if value is not None else ""
     return candidate if candidate in valid else default
 
 
 def _normalize_sort_order(value: str) -> str:
-    return _normalize_enum(value, {"asc", "desc"}, "desc")
+    if isinstance(value, str):
+        alias = _SORT_ORDER_ALIASES.get(value)
+        if alias is not None:
+            return alias
+    return _normalize_enum(value, SORT_ORDER_VALUES, "desc")
 
 
 def _normalize_order_by(endpoint: str, value: str) -> str:
-    if endpoint not in ORDER_BY_RULES:
+    rule = ORDER_BY_RULES.get(endpoint)
+    if rule is None:
         raise ValueError(f"Unsupported order_by endpoint '{endpoint}'")
-    default, valid = ORDER_BY_RULES[endpoint]
+    default, valid = rule
     return _normalize_enum(value, valid, default)
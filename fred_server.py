@@ -12,10 +12,14 @@ from fred_mcp.client import (
     FRED_API_BASE,
     FRED_V2_API_BASE,
     GEOFRED_API_BASE,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
     HTTP_MAX_RETRIES,
+    HTTP_POOL_SIZE,
     HTTP_TIMEOUT_SECONDS,
     RETRYABLE_STATUS_CODES,
     _fred_get,
+    _fred_get_many,
     _fred_v2_get,
     _geofred_get,
 )
@@ -32,11 +36,15 @@ __all__ = [
     "GEOFRED_API_BASE",
     "FRED_V2_API_BASE",
     "HTTP_TIMEOUT_SECONDS",
+    "HTTP_CONNECT_TIMEOUT_SECONDS",
+    "HTTP_POOL_SIZE",
+    "HTTP_KEEPALIVE_EXPIRY_SECONDS",
     "HTTP_MAX_RETRIES",
     "BACKOFF_BASE_SECONDS",
     "BACKOFF_MAX_SECONDS",
     "RETRYABLE_STATUS_CODES",
     "_fred_get",
+    "_fred_get_many",
     "_geofred_get",
     "_fred_v2_get",
 ]
@@ -10,6 +10,10 @@ TEST_API_KEY = "test-fred-api-key"
 @pytest.fixture(autouse=True)
 def _set_default_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("FRED_API_KEY", TEST_API_KEY)
+    fred_client._config.cache_clear()
+    fred_client._response_cache.clear()
+    fred_client._validator_cache.clear()
+    monkeypatch.setattr(fred_client, "_cooldown_until", 0.0)
 
 
 @pytest.fixture(autouse=True)
@@ -21,13 +25,13 @@ def _disable_live_network(respx_mock) -> None:
 
 @pytest.fixture(autouse=True)
 async def _reset_shared_http_client() -> None:
-    # Isolate tests from process-lifetime singleton state.
-    if fred_client._http_client is not None:
-        await fred_client._http_client.aclose()
-    fred_client._http_client = None
-    fred_client._http_client_lock = None
+    # Isolate tests from per-loop shared client state.
+    await fred_client._close_http_client()
+    fred_client._http_clients.clear()
+    fred_client._request_slots.clear()
+    fred_client._global_limiters.clear()
     yield
-    if fred_client._http_client is not None:
-        await fred_client._http_client.aclose()
-    fred_client._http_client = None
-    fred_client._http_client_lock = None
+    await fred_client._close_http_client()
+    fred_client._http_clients.clear()
+    fred_client._request_slots.clear()
+    fred_client._global_limiters.clear()
@@ -1,6 +1,9 @@
+import logging
+
 import pytest
 
 import fred_server
+from fred_mcp.errors import _tool_error_boundary, logger as errors_logger
 
 
 pytestmark = pytest.mark.asyncio
@@ -29,3 +32,19 @@ async def test_passthrough_non_object_json_returns_error_payload(tool) -> None:
     assert result["error"] == "JSON value must be an object"
     assert result["error_details"]["code"] == "validation_error"
     assert result["error_details"]["type"] == "validation_error"
+
+
+async def test_unhandled_error_is_logged_with_message_but_no_traceback(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    @_tool_error_boundary
+    async def broken_tool() -> dict:
+        raise RuntimeError("upstream parser blew up")
+
+    with caplog.at_level(logging.INFO, logger=errors_logger.name):
+        result = await broken_tool()
+
+    assert result["error_details"]["code"] == "internal_error"
+    [record] = caplog.records
+    assert "RuntimeError: upstream parser blew up" in record.getMessage()
+    assert not record.exc_info
@@ -1,7 +1,11 @@
+import asyncio
+
 import httpx
 import pytest
 
 import fred_server
+from fred_mcp import client as fred_client
+from fred_mcp.observations import _encode_observation_cursor
 
 
 pytestmark = pytest.mark.asyncio
@@ -144,3 +148,620 @@ async def test_shared_http_client_retries_failed_requests(
     assert payload["error_details"]["retryable"] is True
     assert route.call_count == fred_server.HTTP_MAX_RETRIES + 1
     assert len(sleep_calls) == fred_server.HTTP_MAX_RETRIES
+
+
+async def test_overload_backoff_holds_back_new_requests(
+    monkeypatch: pytest.MonkeyPatch, respx_mock
+) -> None:
+    sleep_calls: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        sleep_calls.append(delay)
+
+    monkeypatch.setattr(fred_server.asyncio, "sleep", _fake_sleep)
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/busy").mock(
+        side_effect=[httpx.Response(503), httpx.Response(200, json={})]
+    )
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/other").mock(
+        return_value=httpx.Response(200, json={})
+    )
+
+    await fred_server._fred_get("busy", {})
+    await fred_server._fred_get("other", {})
+
+    assert len(sleep_calls) == 2
+    assert 0 < sleep_calls[1] <= sleep_calls[0]
+
+
+async def test_invalid_upstream_json_maps_to_error_payload(respx_mock) -> None:
+    endpoint = "broken"
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/{endpoint}").mock(
+        return_value=httpx.Response(200, content=b"{not json")
+    )
+
+    with pytest.raises(fred_server.FredServerError) as exc_info:
+        await fred_server._fred_get(endpoint, {})
+
+    details = exc_info.value.payload["error_details"]
+    assert details["code"] == "upstream_invalid_json"
+    assert details["endpoint"] == endpoint
+
+
+async def test_shared_http_client_is_reused_per_event_loop() -> None:
+    first = fred_client._get_http_client()
+    second = fred_client._get_http_client()
+
+    assert first is second
+    assert fred_client._http_clients[fred_server.asyncio.get_running_loop()] is first
+
+
+async def test_shared_http_client_is_replaced_after_close() -> None:
+    first = fred_client._get_http_client()
+    await first.aclose()
+
+    second = fred_client._get_http_client()
+
+    assert second is not first
+    assert not second.is_closed
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected"),
+    [
+        ("2", 2.0),
+        ("0.1", fred_server.BACKOFF_BASE_SECONDS),
+        ("600", fred_server.BACKOFF_MAX_SECONDS),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", fred_server.BACKOFF_BASE_SECONDS),
+        ("not-a-date", fred_server.BACKOFF_BASE_SECONDS),
+    ],
+)
+async def test_retry_delay_honors_retry_after_header(
+    monkeypatch: pytest.MonkeyPatch, retry_after: str, expected: float
+) -> None:
+    monkeypatch.setattr(fred_client._retry_rng, "uniform", lambda low, high: (low + high) / 2)
+    response = httpx.Response(503, headers={"Retry-After": retry_after})
+
+    assert fred_client._retry_delay_seconds(1, response) == expected
+
+
+async def test_retry_delay_applies_bounded_jitter() -> None:
+    delays = {fred_client._retry_delay_seconds(2) for _ in range(50)}
+
+    base = fred_server.BACKOFF_BASE_SECONDS * 2
+    assert all(base * 0.5 <= delay <= base * 1.5 for delay in delays)
+    assert len(delays) > 1
+
+
+async def test_shared_http_client_negotiates_compressed_responses(respx_mock) -> None:
+    endpoint = "compressed"
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/{endpoint}").mock(
+        return_value=httpx.Response(200, json={"ok": True})
+    )
+
+    await fred_server._fred_get(endpoint, {})
+
+    accept_encoding = route.calls.last.request.headers["accept-encoding"]
+    assert "gzip" in accept_encoding
+    assert "br" in accept_encoding
+
+
+async def test_fred_get_many_returns_results_in_request_order(respx_mock) -> None:
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/series").mock(
+        side_effect=lambda request: httpx.Response(
+            200, json={"series_id": request.url.params["series_id"]}
+        )
+    )
+
+    results = await fred_server._fred_get_many(
+        [("series", {"series_id": series_id}) for series_id in ("GDP", "CPI", "UNRATE")],
+        concurrency=2,
+    )
+
+    assert [result["series_id"] for result in results] == ["GDP", "CPI", "UNRATE"]
+
+
+async def test_cached_and_uncached_query_paths_send_same_params(respx_mock) -> None:
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/series").mock(
+        return_value=httpx.Response(200, json={"ok": True})
+    )
+
+    await fred_server._fred_get("series", {"series_id": "GDP", "limit": 1})
+    cached_params = route.calls.last.request.url.params
+    await fred_server._fred_get("series", {"series_id": "GDP", "limit": 1.5})
+    uncached_params = route.calls.last.request.url.params
+
+    assert cached_params["limit"] == "1"
+    assert uncached_params["limit"] == "1.5"
+    assert cached_params["api_key"] == uncached_params["api_key"] == "test-fred-api-key"
+
+
+async def test_network_errors_are_retried_then_reported(
+    monkeypatch: pytest.MonkeyPatch, respx_mock
+) -> None:
+    async def _fake_sleep(delay: float) -> None:
+        return None
+
+    monkeypatch.setattr(fred_server.asyncio, "sleep", _fake_sleep)
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/flaky").mock(
+        side_effect=httpx.ConnectError("connection refused")
+    )
+
+    with pytest.raises(fred_server.FredServerError) as exc_info:
+        await fred_server._fred_get("flaky", {})
+
+    details = exc_info.value.payload["error_details"]
+    assert details["code"] == "upstream_network_error"
+    assert details["retryable"] is True
+    assert details["status_code"] is None
+    assert route.call_count == fred_server.HTTP_MAX_RETRIES + 1
+
+
+async def test_http_get_raw_returns_undecoded_json_object_bytes(respx_mock) -> None:
+    body = b' {"observations": []}'
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/raw").mock(
+        return_value=httpx.Response(200, content=body)
+    )
+
+    result = await fred_client._http_get_raw(fred_server.FRED_API_BASE, "raw", {})
+
+    assert result == body
+
+
+async def test_http_get_raw_rejects_non_object_bodies(respx_mock) -> None:
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/raw").mock(
+        return_value=httpx.Response(200, content=b"[1, 2]")
+    )
+
+    with pytest.raises(fred_server.FredServerError) as exc_info:
+        await fred_client._http_get_raw(fred_server.FRED_API_BASE, "raw", {})
+
+    assert exc_info.value.payload["error_details"]["code"] == "upstream_invalid_payload"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("8", 8),
+        ("0", 1),
+        ("many", fred_client.HTTP_POOL_SIZE),
+        ("", fred_client.HTTP_POOL_SIZE),
+    ],
+)
+async def test_pool_size_reads_env_override(
+    monkeypatch: pytest.MonkeyPatch, raw: str, expected: int
+) -> None:
+    monkeypatch.setenv("FRED_HTTP_POOL_SIZE", raw)
+
+    assert fred_client._config().pool_size == expected
+
+
+async def test_reference_responses_are_served_from_cache(respx_mock) -> None:
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/release").mock(
+        return_value=httpx.Response(200, json={"releases": [{"id": 10}]})
+    )
+
+    first = await fred_server.get_release(release_id=10)
+    second = await fred_server.get_release(release_id=10)
+
+    assert first == second == {"releases": [{"id": 10}]}
+    assert route.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "params"),
+    [
+        ("series/observations", {"series_id": "GDP"}),
+        ("release", {"release_id": 10, "realtime_start": "2020-01-01"}),
+    ],
+)
+async def test_time_sensitive_responses_bypass_cache(
+    endpoint: str, params: dict, respx_mock
+) -> None:
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/{endpoint}").mock(
+        return_value=httpx.Response(200, json={"ok": True})
+    )
+
+    await fred_server._fred_get(endpoint, params)
+    await fred_server._fred_get(endpoint, params)
+
+    assert route.call_count == 2
+
+
+async def test_response_cache_can_be_disabled(
+    monkeypatch: pytest.MonkeyPatch, respx_mock
+) -> None:
+    monkeypatch.setenv("FRED_CACHE_TTL", "0")
+    fred_client._config.cache_clear()
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/release").mock(
+        return_value=httpx.Response(200, json={"ok": True})
+    )
+
+    await fred_server._fred_get("release", {"release_id": 10})
+    await fred_server._fred_get("release", {"release_id": 10})
+
+    assert route.call_count == 2
+
+
+async def test_concurrent_identical_requests_share_one_upstream_call(respx_mock) -> None:
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/series/observations").mock(
+        return_value=httpx.Response(200, json={"observations": []})
+    )
+    params = {"series_id": "GDP", "limit": 10}
+
+    first, second = await fred_server.asyncio.gather(
+        fred_server._fred_get("series/observations", params),
+        fred_server._fred_get("series/observations", params),
+    )
+
+    assert first == second == {"observations": []}
+    assert route.call_count == 1
+    assert fred_client._inflight_requests == {}
+
+
+@pytest.mark.parametrize("compact", [True, False])
+async def test_get_releases_compact_flag_controls_row_shape(
+    compact: bool, respx_mock
+) -> None:
+    row = {"id": 10, "name": "GDP", "link": "https://example.test", "notes": "n"}
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/releases").mock(
+        return_value=httpx.Response(200, json={"count": 1, "offset": 0, "releases": [row]})
+    )
+
+    result = await fred_server.get_releases(compact=compact)
+
+    if compact:
+        assert result["releases"] == [
+            {"id": 10, "name": "GDP", "press_release": None, "link": "https://example.test"}
+        ]
+    else:
+        assert result["releases"] == [row]
+
+
+async def test_get_series_bundle_fetches_all_parts(respx_mock) -> None:
+    base = fred_server.FRED_API_BASE
+    respx_mock.get(f"{base}/series").mock(
+        return_value=httpx.Response(200, json={"seriess": [{"id": "GDP"}]})
+    )
+    respx_mock.get(f"{base}/series/categories").mock(
+        return_value=httpx.Response(200, json={"categories": [{"id": 106}]})
+    )
+    observations = respx_mock.get(f"{base}/series/observations").mock(
+        return_value=httpx.Response(
+            200,
+            json={"offset": 0, "observations": [{"date": "2020-01-01", "value": "."}]},
+        )
+    )
+
+    result = await fred_server.get_series_bundle("GDP", limit=5)
+
+    assert result["series"] == {"id": "GDP"}
+    assert result["categories"] == {"categories": [{"id": 106}]}
+    assert result["observations"]["observations"] == [
+        {"date": "2020-01-01", "value": None}
+    ]
+    assert observations.calls.last.request.url.params["limit"] == "5"
+
+
+async def test_conditional_get_reuses_payload_on_not_modified(respx_mock) -> None:
+    # series/observations bypasses the TTL cache, so every call revalidates.
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/series/observations").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                json={"observations": [{"date": "2020-01-01", "value": "1"}]},
+                headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2020 00:00:00 GMT"},
+            ),
+            httpx.Response(304),
+        ]
+    )
+
+    first = await fred_server._fred_get("series/observations", {"series_id": "GDP"})
+    second = await fred_server._fred_get("series/observations", {"series_id": "GDP"})
+
+    assert second == first
+    assert "if-none-match" not in route.calls[0].request.headers
+    revalidation = route.calls[1].request.headers
+    assert revalidation["if-none-match"] == '"v1"'
+    assert revalidation["if-modified-since"] == "Wed, 01 Jan 2020 00:00:00 GMT"
+
+
+async def test_conditional_get_skips_large_bodies(
+    monkeypatch: pytest.MonkeyPatch, respx_mock
+) -> None:
+    monkeypatch.setattr(fred_client, "VALIDATOR_CACHE_MAX_BODY_BYTES", 64)
+    rows = [{"date": "2020-01-01", "value": "1"}] * 10
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/series/observations").mock(
+        return_value=httpx.Response(
+            200, json={"observations": rows}, headers={"ETag": '"v1"'}
+        )
+    )
+
+    await fred_server._fred_get("series/observations", {"series_id": "GDP"})
+    await fred_server._fred_get("series/observations", {"series_id": "GDP"})
+
+    assert fred_client._validator_cache == {}
+    assert "if-none-match" not in route.calls[1].request.headers
+
+
+async def test_conditional_get_skips_no_store_responses(respx_mock) -> None:
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/series/observations").mock(
+        return_value=httpx.Response(
+            200,
+            json={"observations": []},
+            headers={"ETag": '"v1"', "Cache-Control": "no-store"},
+        )
+    )
+
+    await fred_server._fred_get("series/observations", {"series_id": "GDP"})
+    await fred_server._fred_get("series/observations", {"series_id": "GDP"})
+
+    assert "if-none-match" not in route.calls[1].request.headers
+
+
+async def test_get_observations_cursor_pages_by_date(respx_mock) -> None:
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/series/observations").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "offset": 0,
+                "observations": [
+                    {"date": "2024-01-01", "value": "1"},
+                    {"date": "2024-02-01", "value": "2"},
+                ],
+            },
+        )
+    )
+
+    first = await fred_server.get_observations("GDP", limit=2, sort_order="asc")
+    second = await fred_server.get_observations("GDP", limit=2, cursor=first["next_cursor"])
+
+    assert first["next_cursor"] is not None
+    params = route.calls.last.request.url.params
+    assert params["observation_start"] == "2024-02-02"
+    assert params["sort_order"] == "asc"
+    assert params["offset"] == "0"
+    assert second["count"] == 2
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"output_type": 1},
+        {"realtime_start": "2020-01-01", "realtime_end": "2024-01-01"},
+        {"vintage_dates": "2020-01-01,2021-01-01"},
+    ],
+)
+async def test_get_observations_has_no_cursor_for_multi_row_dates(
+    options: dict, respx_mock
+) -> None:
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/series/observations").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "offset": 0,
+                "observations": [
+                    {"date": "2024-01-01", "value": "1"},
+                    {"date": "2024-01-01", "value": "2"},
+                ],
+            },
+        )
+    )
+
+    result = await fred_server.get_observations("GDP", limit=2, **options)
+    rejected = await fred_server.get_observations(
+        "GDP", cursor=_encode_observation_cursor("2024-01-01", "asc"), **options
+    )
+
+    assert result["next_cursor"] is None
+    assert rejected["error_details"]["code"] == "validation_error"
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"frequency": "q"}, {"frequency": "a", "aggregation_method": "eop"}],
+)
+async def test_get_observations_has_no_cursor_for_aggregated_periods(
+    options: dict, respx_mock
+) -> None:
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/series/observations").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "offset": 0,
+                "observations": [
+                    {"date": "2024-01-01", "value": "1"},
+                    {"date": "2024-04-01", "value": "2"},
+                ],
+            },
+        )
+    )
+
+    result = await fred_server.get_observations(
+        "GDP", limit=2, sort_order="asc", **options
+    )
+    rejected = await fred_server.get_observations(
+        "GDP", cursor=_encode_observation_cursor("2024-04-01", "asc"), **options
+    )
+
+    assert result["next_cursor"] is None
+    assert rejected["error_details"]["code"] == "validation_error"
+
+
+async def test_get_observations_rejects_invalid_cursor() -> None:
+    result = await fred_server.get_observations("GDP", cursor="not-a-cursor")
+
+    assert result["error_details"]["code"] == "validation_error"
+
+
+async def test_release_observations_v2_cursor_replaces_offset(respx_mock) -> None:
+    route = respx_mock.get(f"{fred_server.FRED_V2_API_BASE}/release/observations").mock(
+        return_value=httpx.Response(200, json={"next_cursor": "abc", "series": []})
+    )
+
+    result = await fred_server.get_release_observations_v2(
+        release_id=53, offset=10, next_cursor="xyz"
+    )
+
+    assert result["next_cursor"] == "abc"
+    params = route.calls.last.request.url.params
+    assert params["next_cursor"] == "xyz"
+    assert "offset" not in params
+
+
+async def test_admission_controller_shrinks_on_overload_and_recovers() -> None:
+    slots = fred_client._AdmissionController(8)
+
+    slots.record(429, slots.epoch)
+    slots.record(503, slots.epoch)
+    assert slots.limit == 2
+
+    for _ in range(40):
+        slots.record(200, slots.epoch)
+    assert slots.limit == 8
+
+
+async def test_admission_controller_counts_a_concurrent_burst_once() -> None:
+    slots = fred_client._AdmissionController(64)
+    sent_at = slots.epoch
+
+    for _ in range(64):
+        slots.record(429, sent_at)
+
+    assert slots.limit == 32
+
+
+async def test_admission_controller_treats_not_modified_as_success() -> None:
+    slots = fred_client._AdmissionController(8)
+    slots.record(503, slots.epoch)
+
+    for _ in range(30):
+        slots.record(304, slots.epoch)
+
+    assert slots.limit == 8
+
+
+async def test_admission_controller_holds_requests_over_the_limit() -> None:
+    slots = fred_client._AdmissionController(1)
+    order: list[str] = []
+
+    async def worker(name: str) -> None:
+        async with slots:
+            order.append(f"{name}-in")
+            await asyncio.sleep(0)
+            order.append(f"{name}-out")
+
+    await asyncio.gather(worker("a"), worker("b"))
+
+    assert order == ["a-in", "a-out", "b-in", "b-out"]
+
+
+async def test_admission_controller_keeps_slot_when_exit_is_cancelled_twice() -> None:
+    slots = fred_client._AdmissionController(1)
+    entered = asyncio.Event()
+
+    async def holder() -> None:
+        async with slots:
+            entered.set()
+            await asyncio.sleep(3600)
+
+    task = asyncio.create_task(holder())
+    await entered.wait()
+    # Make __aexit__ wait for the lock, then cancel it again while it does.
+    await slots._condition.acquire()
+    task.cancel()
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0)
+    slots._condition.release()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert slots._in_flight == 0
+    async with asyncio.timeout(1):
+        async with slots:
+            pass
+
+
+async def test_admission_controller_passes_wakeup_on_when_waiter_is_cancelled() -> None:
+    slots = fred_client._AdmissionController(1)
+    release = asyncio.Event()
+    entered: list[str] = []
+    waiters: list[asyncio.Task] = []
+
+    async def holder() -> None:
+        async with slots:
+            await release.wait()
+        # "a" has been notified but has not re-taken the lock yet.
+        waiters[0].cancel()
+
+    async def waiter(name: str) -> None:
+        async with slots:
+            entered.append(name)
+
+    holding = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiters.append(asyncio.create_task(waiter("a")))
+    waiters.append(asyncio.create_task(waiter("b")))
+    await asyncio.sleep(0)
+
+    release.set()
+    await holding
+    async with asyncio.timeout(1):
+        await waiters[1]
+
+    assert entered == ["b"]
+    assert waiters[0].cancelled()
+    assert slots._in_flight == 0
+
+
+async def test_series_list_rows_are_compacted(respx_mock) -> None:
+    row = {"id": "GDP", "title": "Gross Domestic Product", "notes": "long text"}
+    respx_mock.get(f"{fred_server.FRED_API_BASE}/category/series").mock(
+        return_value=httpx.Response(200, json={"count": 1, "seriess": [row]})
+    )
+
+    result = await fred_server.get_category_series(category_id=106)
+
+    assert result["results"] == [
+        {
+            "id": "GDP",
+            "title": "Gross Domestic Product",
+            "frequency": None,
+            "units": None,
+            "observation_start": None,
+            "observation_end": None,
+            "popularity": None,
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "cache_control", "expected"),
+    [
+        ("category", None, fred_client.RESPONSE_CACHE_TTL_SECONDS),
+        ("category", "public, max-age=60", 60),
+        ("category", "no-store", 0),
+        ("category", "no-cache, max-age=60", 0),
+        ("shapes/file", None, 86400),
+        ("shapes/file", "max-age=5", 5),
+    ],
+)
+async def test_response_ttl_follows_cache_control(
+    endpoint: str, cache_control: str | None, expected: int
+) -> None:
+    headers = {"Cache-Control": cache_control} if cache_control else {}
+
+    assert fred_client._response_ttl(endpoint, httpx.Response(200, headers=headers)) == expected
+
+
+async def test_response_cache_skips_max_age_zero(respx_mock) -> None:
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/category").mock(
+        return_value=httpx.Response(
+            200, json={"categories": []}, headers={"Cache-Control": "max-age=0"}
+        )
+    )
+
+    await fred_server._fred_get("category", {"category_id": 1})
+    await fred_server._fred_get("category", {"category_id": 1})
+
+    assert route.call_count == 2
@@ -0,0 +1,145 @@
+import asyncio
+import importlib.util
+import logging
+
+import httpx
+import pytest
+
+import fred_server
+from fred_mcp import client as fred_client
+from fred_mcp import limiter as fred_limiter
+from fred_mcp.limiter import _RedisConcurrencyLimiter
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FakeRedisError(Exception):
+    pass
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis"):
+        self._redis = redis
+        self._ops: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def __getattr__(self, name: str):
+        return lambda *args: self._ops.append((name, args))
+
+    async def execute(self) -> list:
+        if self._redis.hang:
+            await asyncio.Event().wait()
+        results = []
+        for name, args in self._ops:
+            results.append(getattr(self._redis, f"_{name}")(*args))
+        return results
+
+
+class _FakeRedis:
+    def __init__(self, fail: bool = False, hang: bool = False):
+        self.members: dict[str, float] = {}
+        self.fail = fail
+        self.hang = hang
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        if self.fail:
+            raise _FakeRedisError("down")
+        return _FakePipeline(self)
+
+    def _zremrangebyscore(self, key: str, low: float, high: float) -> int:
+        stale = [m for m, score in self.members.items() if low <= score <= high]
+        for member in stale:
+            del self.members[member]
+        return len(stale)
+
+    def _zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.members.update(mapping)
+        return len(mapping)
+
+    def _zcard(self, key: str) -> int:
+        return len(self.members)
+
+    def _expire(self, key: str, seconds: int) -> bool:
+        return True
+
+    async def zrem(self, key: str, member: str) -> int:
+        return 1 if self.members.pop(member, None) is not None else 0
+
+
+def _limiter(redis: _FakeRedis, max_in_flight: int) -> _RedisConcurrencyLimiter:
+    return _RedisConcurrencyLimiter(redis, "k", max_in_flight, _FakeRedisError)
+
+
+async def test_redis_limiter_rejects_requests_over_the_cap() -> None:
+    redis = _FakeRedis()
+    limiter = _limiter(redis, 1)
+
+    first = await limiter.acquire()
+    second = await limiter.acquire()
+
+    assert first is not None
+    assert second is None
+    assert list(redis.members) == [first]
+
+    await limiter.release(first)
+    assert redis.members == {}
+
+
+async def test_redis_limiter_fails_open_when_redis_is_down() -> None:
+    limiter = _limiter(_FakeRedis(fail=True), 1)
+
+    assert await limiter.acquire() is not None
+
+
+async def test_redis_limiter_fails_open_when_redis_hangs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(fred_limiter, "LIMITER_TIMEOUT_SECONDS", 0.01)
+    limiter = _limiter(_FakeRedis(hang=True), 1)
+
+    async with asyncio.timeout(1):
+        assert await limiter.acquire() is not None
+
+
+async def test_global_limit_surfaces_rate_limited_error(
+    monkeypatch: pytest.MonkeyPatch, respx_mock
+) -> None:
+    redis = _FakeRedis()
+    redis.members["held-by-another-worker"] = float("inf")
+    monkeypatch.setattr(fred_client, "_get_global_limiter", lambda: _limiter(redis, 1))
+    route = respx_mock.get(f"{fred_server.FRED_API_BASE}/category").mock(
+        return_value=httpx.Response(200, json={})
+    )
+
+    result = await fred_server.get_category(category_id=1)
+
+    assert result["error_details"]["code"] == "rate_limited"
+    assert result["error_details"]["retryable"] is True
+    assert route.call_count == 0
+
+
+async def test_global_limiter_is_disabled_without_redis_url() -> None:
+    assert fred_client._get_global_limiter() is None
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("redis") is not None, reason="redis is installed"
+)
+async def test_global_limiter_without_redis_package_logs_and_disables(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+    fred_client._config.cache_clear()
+
+    with caplog.at_level(logging.ERROR, logger=fred_client.logger.name):
+        assert fred_client._get_global_limiter() is None
+        assert fred_client._get_global_limiter() is None
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert len(messages) == 1
+    assert "fred-mcp[redis]" in messages[0]
@@ -0,0 +1,41 @@
+import math
+
+import pytest
+
+from fred_mcp.observations import _observation_columns, _observations_to_arrays
+
+
+def test_observations_to_arrays_maps_missing_sentinel_to_nan() -> None:
+    np = pytest.importorskip("numpy")
+    payload = {
+        "observations": [
+            {"date": "2024-01-01", "value": "."},
+            {"date": "2024-02-01", "value": "1.23"},
+        ]
+    }
+
+    dates, values = _observations_to_arrays(payload)
+
+    assert dates.dtype == np.dtype("datetime64[D]")
+    assert dates.tolist()[1].isoformat() == "2024-02-01"
+    assert values.dtype == np.float64
+    assert math.isnan(values[0])
+    assert values[1] == pytest.approx(1.23)
+
+
+def test_observations_to_arrays_handles_empty_payload() -> None:
+    pytest.importorskip("numpy")
+
+    dates, values = _observations_to_arrays({})
+
+    assert len(dates) == 0
+    assert len(values) == 0
+
+
+def test_observation_columns_split_rows_into_lists() -> None:
+    rows = [{"date": "2024-01-01", "value": "."}, {"date": "2024-02-01", "value": "1.5"}]
+
+    assert _observation_columns(rows) == {
+        "date": ["2024-01-01", "2024-02-01"],
+        "value": [None, "1.5"],
+    }